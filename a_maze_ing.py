@@ -18,35 +18,106 @@ from mazegen import (
 )
 from print_ascii import AsciiPrinter
 from create_output_txt import OutputGenerator
+from concurrent.futures import Future
+from threading import Thread
 import sys
-from typing import Dict
+from typing import Iterator
 
+MENU_CHOICES: tuple[str, ...] = (
+    "Re-generate a new maze",
+    "Show/Hide path from entry to exit",
+    "Rotate maze colors",
+    "Quit"
+)
+MENU_TEXT: str = (
+    "=== A-Maze-ing ===\n" +
+    "".join(f"{num}. {info}\n" for num, info in enumerate(MENU_CHOICES, 1)) +
+    f"Choice? (1-{len(MENU_CHOICES)}): "
+)
+INVALID_CHOICE_TEXT: str = (
+    f"\nPlease enter a number between 1 and {len(MENU_CHOICES)}.\n"
+)
 
-def generate_maze(config: Config, maze_generator: MazeGenerator) -> Maze:
-    """Generate a maze and write it to an output file.
 
-    Use the ``MazeGenerator`` instance and then ``OutputGenerator``
-    to save the generated maze to a text file defined in the
-    configuration.
+def generate_maze(maze_generator: MazeGenerator) -> Maze:
+    """Generate a new maze without writing it anywhere.
 
     Args:
-        config (Config): Configuration object containing maze settings.
         maze_generator (MazeGenerator): Instance responsible for
             generating the maze structure.
 
     Returns:
         Maze: The generated maze instance.
     """
-    maze = maze_generator.create_maze()
-    output = OutputGenerator()
+    return maze_generator.create_maze()
+
+
+def save_maze(maze: Maze, config: Config, output: OutputGenerator) -> None:
+    """Write a maze to the output file defined in the configuration.
+
+    Only needed when the maze itself changes: display toggles (path and
+    colours) don't modify the maze, so they don't touch the file. Re-generated
+    mazes are saved unless the configuration sets SAVE_REGENERATED=False.
+
+    Args:
+        maze (Maze): The maze to save.
+        config (Config): Configuration object containing maze settings.
+        output (OutputGenerator): Instance responsible for writing the
+            maze to the output file.
+    """
     output.create_output_txt(maze, config)
-    return maze
+
+
+def pregenerate_maze(maze_generator: MazeGenerator) -> Future[Maze]:
+    """Start generating the next maze in a background thread.
+
+    The thread is a daemon, so quitting never waits for a maze that is
+    still being generated and that nobody will use.
+
+    Args:
+        maze_generator (MazeGenerator): Instance responsible for
+            generating the maze structure.
+
+    Returns:
+        Future[Maze]: The maze being generated.
+    """
+    future: Future[Maze] = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(generate_maze(maze_generator))
+        except BaseException as e:
+            future.set_exception(e)
+
+    Thread(target=run, daemon=True).start()
+    return future
+
+
+def read_choices() -> Iterator[str]:
+    """Yield the choices entered by the user.
+
+    In a terminal, the menu is shown as prompt before each choice. When
+    stdin is not a terminal (e.g. a script of commands piped into the
+    program), all commands are read at once and yielded without prompting.
+
+    Yields:
+        str: The raw choice, one per command.
+    """
+    if not sys.stdin.isatty():
+        yield from sys.stdin.read().split()
+        return
+    while True:
+        yield input(MENU_TEXT)
 
 
 def interact_with_user(
         maze: Maze,
         config: Config,
-        maze_generator: MazeGenerator
+        maze_generator: MazeGenerator,
+        printer: AsciiPrinter,
+        output: OutputGenerator
 ) -> None:
     """Start an interactive CLI session for maze manipulation.
 
@@ -56,31 +127,41 @@ def interact_with_user(
         3. Rotate maze colors
         4. Quit the application
 
-    The function runs in a loop until the user selects the quit option.
-    Invalid inputs are handled gracefully and prompt the user again.
+    The function runs in a loop until the user selects the quit option, or
+    until piped commands run out. Invalid inputs are handled gracefully and
+    prompt the user again. The menu text is built once at import and shown
+    as the input prompt.
+
+    The printer and output generator are created once by the caller and
+    reused for every action, so the colour and path display state is kept
+    across re-generations.
+
+    While the user reads the menu, the next maze is already generated in a
+    background thread (see `pregenerate_maze`), so re-generating only has
+    to wait for what is left of it. Mazes are still generated one after the
+    other by the same generator, so the sequence of mazes doesn't change.
+    Leaving the session doesn't wait for the pending maze.
 
     Args:
         maze (Maze): The current maze instance to interact with.
+        config (Config): Configuration object containing maze settings.
+        maze_generator (MazeGenerator): Instance generating new mazes.
+        printer (AsciiPrinter): Printer used to display the maze.
+        output (OutputGenerator): Instance writing the output file.
     """
-    choices: Dict[int, str] = {
-        1: "Re-generate a new maze",
-        2: "Show/Hide path from entry to exit",
-        3: "Rotate maze colors",
-        4: "Quit"
-    }
-
-    while True:
-        print("=== A-Maze-ing ===")
-        for num, info in choices.items():
-            print(f"{num}. {info}")
+    next_maze = pregenerate_maze(maze_generator)
+    for command in read_choices():
         try:
-            choice = int(input("Choice? (1-4): "))
+            choice = int(command)
         except ValueError:
-            print("\nPlease enter a number between 1 and 4.\n")
+            print(INVALID_CHOICE_TEXT)
             continue
 
         if choice == 1:
-            maze = generate_maze(config, maze_generator)
+            maze = next_maze.result()
+            next_maze = pregenerate_maze(maze_generator)
+            if config.save_regenerated:
+                save_maze(maze, config, output)
         elif choice == 2:
             printer.toggle_path()
         elif choice == 3:
@@ -88,7 +169,7 @@ def interact_with_user(
         elif choice == 4:
             break
         else:
-            print("\nPlease enter a number between 1 and 4.\n")
+            print(INVALID_CHOICE_TEXT)
             continue
 
         printer.print_maze(maze)
@@ -105,9 +186,11 @@ if __name__ == "__main__":
         try:
             config = ConfigParser().load(sys.argv[1])
             maze_generator = MazeGenerator(config)
-            maze = generate_maze(config, maze_generator)
+            output = OutputGenerator()
+            maze = generate_maze(maze_generator)
+            save_maze(maze, config, output)
             printer = AsciiPrinter()
             printer.print_maze(maze)
-            interact_with_user(maze, config, maze_generator)
+            interact_with_user(maze, config, maze_generator, printer, output)
         except (ConfigFileError, MazeGeneratorError, OSError) as e:
             print(f"Error: {e}")
@@ -2,8 +2,13 @@
 
 # from typing import TYPE_CHECKING
 from pathlib import Path
+from typing import Iterator
 from mazegen import Maze, Config, Cell
 
+# Hex digit of each wall mask. The wall bits of the maze are the bits of the
+# digit (north → bit 0, east → bit 1, south → bit 2, west → bit 3).
+HEX_DIGITS: bytes = bytes.maketrans(bytes(range(16)), b"0123456789ABCDEF")
+
 
 class OutputGenerator:
     @staticmethod
@@ -12,36 +17,33 @@ class OutputGenerator:
         Encode a Cell's directional flags (north, east, south, west) as a
         single uppercase hex digit.
 
-        Each direction is treated as a 1-bit value and combined into a 4-bit
-        integer:
+        Each direction is a 1-bit value of the cell's packed wall mask:
         west → bit 3, south → bit 2, east → bit 1, north → bit 0.
+        The mask is looked up directly in `HEX_DIGITS`, the same table
+        `format_rows` uses for whole rows.
 
         Parameters:
-            cell (Cell): A Cell with 'north', 'east', 'south', 'west'
-            attributes (0 or 1).
+            cell (Cell): The Cell to encode.
 
         Returns:
             str: Uppercase hexadecimal digit representing the 4 directional
             bits.
         """
-
-        bit: int = 0
-        bit |= (cell.west & 1)
-        bit = bit << 1 | (cell.south & 1)
-        bit = bit << 1 | (cell.east & 1)
-        bit = bit << 1 | (cell.north & 1)
-        hex_digit: str = format(bit, "X")
-        return hex_digit    # does raising errors here make sense or redundant?
+        return chr(HEX_DIGITS[cell.maze.walls[cell.index]])
 
     def create_output_txt(self, maze: Maze, config_obj: Config) -> None:
         """
         Write a textual representation of the maze and configuration to a file.
 
         The maze is output as a grid of hexadecimal digits, where each Cell is
-        converted to a single hex digit using `convert_cell_to_hex_digit`.
+        converted to a single hex digit (see `format_rows`).
         After the maze, the entry and exit coordinates from the configuration
         object are printed. The fastest path to exit is added last.
 
+        The file is opened in binary mode with a 64 KB buffer and the maze is
+        handed over as ASCII bytes one row at a time, so writing neither
+        issues a call per cell nor goes through a text codec.
+
         Parameters:
             maze (List[List[Cell]]): A 2D list representing the maze grid of
             Cell objects.
@@ -52,20 +54,36 @@ class OutputGenerator:
         file_path: Path = Path(file_name)   # add actual path!
 
         try:
-            with open(file_path, "w",  encoding="utf-8") as file:
-                for row in maze.grid:
-                    for cell in row:
-                        file.write(f"{self.convert_cell_to_hex_digit(cell)}")
-                    file.write("\n")
-
-                file.write("\n")
-                file.write(f"{config_obj.entry[0]},{config_obj.entry[1]}\n")
-                file.write(f"{config_obj.exit[0]},{config_obj.exit[1]}\n")
-                file.write(f"{self.format_path(maze)}")
+            with open(file_path, "wb", buffering=65536) as file:
+                file.writelines(self.format_rows(maze))
+                file.write((
+                    f"\n{config_obj.entry[0]},{config_obj.entry[1]}\n"
+                    f"{config_obj.exit[0]},{config_obj.exit[1]}\n"
+                    f"{self.format_path(maze)}"
+                ).encode("ascii"))
 
         except OSError as err:
             raise OSError(f"ERROR while opening {file_name}: {err}")
 
+    def format_rows(self, maze: Maze) -> Iterator[bytes]:
+        """Yield the maze rows as lines of hexadecimal digits.
+
+        The wall plane of the maze is already a sequence of 4-bit masks in
+        the output bit order, so it is converted with a single
+        `bytes.translate` through `HEX_DIGITS` and then sliced into rows,
+        instead of one `convert_cell_to_hex_digit` call per cell.
+
+        Args:
+            maze (Maze): The maze to convert.
+
+        Yields:
+            bytes: One row of ASCII hex digits, one per cell, ending with a
+            newline.
+        """
+        digits: bytes = bytes(maze.walls).translate(HEX_DIGITS)
+        for start in range(0, maze.width * maze.height, maze.width):
+            yield digits[start:start + maze.width] + b"\n"
+
     def format_path(self, maze: Maze) -> str:
         """Convert a maze path into a string of directional moves.
 
@@ -0,0 +1,281 @@
+from typing import Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from .errors import (
+    ConfigFileNotFoundError,
+    WrongValueError,
+    KeyValueError,
+    SyntaxError,
+    DimensionsError,
+    PointBoundError,
+    EntryExitError,
+    MandatoryKeyError
+)
+from typing import List, Dict
+
+
+@dataclass(frozen=True, slots=True)
+class Config():
+    """Store and validate maze configuration parameters.
+
+    This class represents the validated configuration used for maze
+    generation, including dimensions, entry/exit coordinates,
+    output file name, generation mode and optional seed.
+
+    Validation is automatically performed after initialization. The
+    configuration is immutable, so a loaded instance can be safely shared.
+
+    Attributes:
+        width (int): Maze width (number of columns).
+        height (int): Maze height (number of rows).
+        entry (tuple[int, int]): Entry coordinate (x, y).
+        exit (tuple[int, int]): Exit coordinate (x, y).
+        output_file (str): Output file path for maze export.
+        perfect (bool): Whether the maze should be perfect
+            (with only one solution and no loops).
+        seed (Optional[int]): Random seed for reproducibility.
+        save_regenerated (bool): Whether a re-generated maze is written to
+            the output file too (the first maze always is).
+    """
+    width: int
+    height: int
+    entry: tuple[int, int]
+    exit: tuple[int, int]
+    output_file: str
+    perfect: bool
+    seed: Optional[int] = None
+    save_regenerated: bool = True
+
+    def __post_init__(self) -> None:
+        """Validate configuration values after initialization.
+
+        Checks in a single pass, reading every field only once, that:
+            - Dimensions are valid: the maze has at least 2 rows and 2
+              columns (if there are no decision to make, it is not a maze).
+            - Entry and exit are within bounds.
+            - Entry and exit are not identical.
+
+        Raises:
+            DimensionsError: If width or height is less than 2.
+            PointBoundError: If the entry or exit coordinate is outside
+                the maze dimensions.
+            EntryExitError: If entry and exit coordinates are identical.
+        """
+        width = self.width
+        height = self.height
+        entry_x, entry_y = entry = self.entry
+        exit_x, exit_y = exit = self.exit
+
+        if width < 2:
+            raise DimensionsError("WIDTH", width)
+        if height < 2:
+            raise DimensionsError("HEIGHT", height)
+        if not (0 <= entry_x < width and 0 <= entry_y < height):
+            raise PointBoundError("ENTRY", entry)
+        if not (0 <= exit_x < width and 0 <= exit_y < height):
+            raise PointBoundError("EXIT", exit)
+        if entry_x == exit_x and entry_y == exit_y:
+            raise EntryExitError(entry, exit)
+
+
+class ConfigParser():
+    """Parse configuration files and construct Config objects.
+
+    This class reads key-value pairs from a configuration file,
+    validates required fields, converts values to appropriate types,
+    and returns a fully validated Config instance.
+    """
+    @staticmethod
+    def load(file_name: str) -> Config:
+        """Load configuration from a file.
+
+        The file must contain key=value pairs for all mandatory fields:
+        WIDTH, HEIGHT, ENTRY, EXIT, OUTPUT_FILE, PERFECT.
+        SEED and SAVE_REGENERATED (default True) are optional.
+
+        Args:
+            file_name (str): Path to the configuration file.
+
+        Returns:
+            Config: Validated configuration object.
+
+        Raises:
+            ConfigFileNotFoundError: If the file does not exist.
+            MandatoryKeyError: If a required key is missing.
+            WrongValueError: If a value cannot be converted properly.
+            KeyValueError: If a line is not in key=value format.
+        """
+        try:
+            modified = Path(file_name).stat().st_mtime_ns
+        except FileNotFoundError as e:
+            raise ConfigFileNotFoundError(str(e).split(": ")[1])
+        return ConfigParser.cached_load(file_name, modified)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def cached_load(file_name: str, modified: int) -> Config:
+        """Parse a configuration file, caching the result.
+
+        The cache is keyed by the file path and its modification time, so an
+        unchanged file is parsed only once while an edited one is re-read.
+        Errors are not cached.
+
+        Args:
+            file_name (str): Path to the configuration file.
+            modified (int): Modification time of the file, in nanoseconds.
+
+        Returns:
+            Config: Validated configuration object.
+
+        Raises:
+            ConfigFileNotFoundError: If the file does not exist.
+            MandatoryKeyError: If a required key is missing.
+            WrongValueError: If a value cannot be converted properly.
+            KeyValueError: If a line is not in key=value format.
+        """
+        data: Dict[str, str] = {}
+        try:
+            with open(file_name, "r") as file:
+                for line in file:
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    key, value = ConfigParser.get_key_value(line)
+                    data[key.upper()] = value
+                return Config(
+                    width=int(data["WIDTH"]),
+                    height=int(data["HEIGHT"]),
+                    entry=ConfigParser.parse_coordinate(True, data["ENTRY"]),
+                    exit=ConfigParser.parse_coordinate(False, data["EXIT"]),
+                    output_file=ConfigParser.parse_file_name(
+                        "OUTPUT_FILE", data["OUTPUT_FILE"]
+                    ),
+                    perfect=ConfigParser.parse_bool(data["PERFECT"]),
+                    seed=ConfigParser.parse_seed(data),
+                    save_regenerated=ConfigParser.parse_bool(
+                        data.get("SAVE_REGENERATED", "True"),
+                        "SAVE_REGENERATED"
+                    )
+                )
+        except FileNotFoundError as e:
+            raise ConfigFileNotFoundError(str(e).split(": ")[1])
+        except ValueError as e:
+            raise WrongValueError(str(e).split(": ")[1])
+        except KeyError as e:
+            raise MandatoryKeyError(str(e))
+
+    @staticmethod
+    def get_key_value(line: str) -> List[str]:
+        """Extract a key-value pair from a line from the configuration file.
+
+        This function processes a single line from a configuration file,
+        ignoring any inline comments (denoted by `#`). It returns the key
+        and value as a list of two strings. The function expects lines in the
+        format KEY=VALUE. The comment and the key are cut off with
+        `str.partition`, which doesn't build any intermediate list.
+
+        Args:
+            line (str): A line from the configuration file.
+
+        Returns:
+            List[str]: A list containing the key and value as strings.
+
+        Raises:
+            KeyValueError: If the line does not contain a valid key-value pair.
+
+        Examples:
+            >>> get_key_value("WIDTH=10")
+            ['WIDTH', '10']
+            >>> get_key_value("HEIGHT=20 # height of the maze")
+            ['HEIGHT', '20']
+        """
+        content, _, _ = line.partition("#")
+        key, separator, value = content.partition("=")
+        if not separator or "=" in value:
+            raise KeyValueError(line)
+        return [key.strip(), value.strip()]
+
+    @staticmethod
+    def parse_coordinate(is_entry: bool, data: str) -> tuple[int, int]:
+        """Parse a coordinate string in (x,y) format.
+
+        Args:
+            is_entry (bool): True if parsing ENTRY, False if EXIT.
+            data (str): Coordinate string (e.g., "3,4").
+
+        Returns:
+            tuple[int, int]: Parsed (x, y) coordinate.
+
+        Raises:
+            SyntaxError: If the format is invalid.
+            ValueError: If values cannot be converted to integers.
+        """
+        name = "ENTRY"
+        if not is_entry:
+            name = "EXIT"
+        coordinate = data.split(",")
+        if len(coordinate) != 2:
+            raise SyntaxError(name, data, "in (x,y) format")
+        return (int(coordinate[0]), int(coordinate[1]))
+
+    @staticmethod
+    def parse_file_name(name: str, data: str) -> str:
+        """Validate and parse output file name.
+
+        Ensures the file has a '.txt' extension.
+
+        Args:
+            name (str): Configuration key name.
+            data (str): File name string.
+
+        Returns:
+            str: Validated file name.
+
+        Raises:
+            SyntaxError: If the file extension is not '.txt'.
+        """
+        if Path(data).suffix != ".txt":
+            raise SyntaxError(
+                name, data, "of '.txt' extension"
+            )
+        return (data)
+
+    @staticmethod
+    def parse_bool(data: str, name: str = "PERFECT") -> bool:
+        """Parse a boolean configuration value.
+
+        Accepts 'True' or 'False' (case-insensitive).
+
+        Args:
+            data (str): Boolean string value.
+            name (str): Configuration key name, used in the error message.
+
+        Returns:
+            bool: Parsed boolean value.
+
+        Raises:
+            SyntaxError: If the value is not 'True' or 'False'.
+        """
+        if data.capitalize() == "True":
+            return True
+        if data.capitalize() == "False":
+            return False
+        raise SyntaxError(name, data, "True or False")
+
+    @staticmethod
+    def parse_seed(data: Dict[str, str]) -> Optional[int]:
+        """Parse optional random seed value.
+
+        Args:
+            data (Dict[str, str]): Parsed key-value pairs.
+
+        Returns:
+            Optional[int]: Integer seed if provided, otherwise None.
+
+        Raises:
+            ValueError: If the seed cannot be converted to an integer.
+        """
+        if data.get("SEED") is not None:
+            return (int(data["SEED"]))
+        return None
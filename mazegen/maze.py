@@ -0,0 +1,503 @@
+from typing import Iterator, List, Optional
+from enum import IntEnum
+
+type Coordinate = tuple[int, int]
+
+# Wall bits of a cell, in the order of the hexadecimal output format.
+NORTH = 1
+EAST = 2
+SOUTH = 4
+WEST = 8
+ALL_WALLS = NORTH | EAST | SOUTH | WEST
+
+# Bits of the wall to knock down in the first and in the second cell when
+# moving by (dx, dy), indexed by dy * 3 + dx + 4.
+WALLS_BY_STEP: tuple[tuple[int, ...], ...] = (
+    (), (NORTH, SOUTH), (),
+    (WEST, EAST), (), (EAST, WEST),
+    (), (SOUTH, NORTH), ()
+)
+
+
+class CellType(IntEnum):
+    """Possible cell types in a maze.
+
+    The members are integers, so they are stored in and compared with the
+    type plane of a maze directly, without going through `.value`.
+
+    Attributes:
+        OPEN: A walkable cell.
+        BLOCKED: A cell fully closed for the "42" pattern.
+        PATH: A cell that is part of the solved path.
+        ENTRY: The maze entry point.
+        EXIT: The maze exit point.
+    """
+    OPEN = 0
+    BLOCKED = 1
+    PATH = 2
+    ENTRY = 3
+    EXIT = 4
+
+
+class Cell:
+    """Represent a single maze cell.
+
+    A cell contains four walls (north, south, east, west) and a type
+    describing its role in the maze (open, blocked, path, entry, exit).
+
+    The cell doesn't store any data itself: it is a lightweight view on
+    one position of the planes of its maze, so reading or writing an
+    attribute reads or writes the maze directly. It is kept for backward
+    compatibility, hot paths should use the maze planes instead.
+
+    `Cell(west=..., south=..., east=..., north=..., type=...)` still creates
+    a standalone cell, backed by its own one-cell maze, with all walls
+    present and an open type by default. Views on an existing maze are
+    created with `Cell.view`. Cells compare equal when their walls and type
+    are the same, wherever they are stored.
+
+    Attributes:
+        west (bool): Whether a west wall exists.
+        south (bool): Whether a south wall exists.
+        east (bool): Whether an east wall exists.
+        north (bool): Whether a north wall exists.
+        type (CellType): The type of the cell.
+    """
+    __slots__ = ("maze", "index")
+
+    # One letter per CellType value, used by __repr__.
+    TYPE_LETTERS = ("O", "B", "P", "e", "E")
+
+    maze: "Maze"
+    index: int
+
+    def __init__(
+            self,
+            west: bool = True,
+            south: bool = True,
+            east: bool = True,
+            north: bool = True,
+            type: CellType = CellType.OPEN
+    ) -> None:
+        """Create a standalone cell with the given walls and type.
+
+        Args:
+            west (bool): Whether a west wall exists.
+            south (bool): Whether a south wall exists.
+            east (bool): Whether an east wall exists.
+            north (bool): Whether a north wall exists.
+            type (CellType): The type of the cell.
+        """
+        self.maze = Maze(1, 1)
+        self.index = 0
+        self.set(west, south, east, north, type)
+
+    @classmethod
+    def view(cls, maze: "Maze", x: int, y: int) -> "Cell":
+        """Create a view on the cell at the given coordinates.
+
+        Args:
+            maze (Maze): The maze holding the cell data.
+            x (int): Column index.
+            y (int): Row index.
+
+        Returns:
+            Cell: A cell reading and writing the planes of the maze.
+        """
+        cell = cls.__new__(cls)
+        cell.maze = maze
+        cell.index = y * maze.width + x
+        return cell
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if both cells have the same walls and type.
+
+        Like the dataclass it replaces, a cell is mutable, so it is not
+        hashable.
+        """
+        if not isinstance(other, Cell):
+            return NotImplemented
+        return (
+            self.maze.walls[self.index] == other.maze.walls[other.index] and
+            self.maze.type[self.index] == other.maze.type[other.index]
+        )
+
+    def __repr__(self) -> str:
+        """Return a compact text form of the cell, e.g. ``Ow1s0e1n1O``.
+
+        The type letter surrounds the four wall bits (west, south, east,
+        north), built with a single f-string from the packed wall byte.
+        """
+        walls = self.maze.walls[self.index]
+        letter = self.TYPE_LETTERS[self.maze.type[self.index]]
+        return (
+            f"{letter}w{walls >> 3 & 1}s{walls >> 2 & 1}"
+            f"e{walls >> 1 & 1}n{walls & 1}{letter}"
+        )
+
+    @property
+    def west(self) -> bool:
+        """Return True if the west wall exists."""
+        return self.maze.walls[self.index] & WEST != 0
+
+    @west.setter
+    def west(self, value: bool) -> None:
+        self.update_wall(WEST, value)
+
+    @property
+    def south(self) -> bool:
+        """Return True if the south wall exists."""
+        return self.maze.walls[self.index] & SOUTH != 0
+
+    @south.setter
+    def south(self, value: bool) -> None:
+        self.update_wall(SOUTH, value)
+
+    @property
+    def east(self) -> bool:
+        """Return True if the east wall exists."""
+        return self.maze.walls[self.index] & EAST != 0
+
+    @east.setter
+    def east(self, value: bool) -> None:
+        self.update_wall(EAST, value)
+
+    @property
+    def north(self) -> bool:
+        """Return True if the north wall exists."""
+        return self.maze.walls[self.index] & NORTH != 0
+
+    @north.setter
+    def north(self, value: bool) -> None:
+        self.update_wall(NORTH, value)
+
+    def update_wall(self, bit: int, value: bool) -> None:
+        """Add or remove one wall of the cell.
+
+        Args:
+            bit (int): Wall bit to update (NORTH, EAST, SOUTH or WEST).
+            value (bool): True to add the wall, False to remove it.
+        """
+        if value:
+            self.maze.walls[self.index] |= bit
+        else:
+            self.maze.walls[self.index] &= ~bit
+
+    @property
+    def type(self) -> CellType:
+        """Return the type of the cell."""
+        return CellType(self.maze.type[self.index])
+
+    @type.setter
+    def type(self, value: CellType) -> None:
+        self.maze.type[self.index] = value
+
+    @property
+    def open(self) -> bool:
+        """Return True if the cell is open."""
+        return self.maze.type[self.index] == CellType.OPEN
+
+    @property
+    def blocked(self) -> bool:
+        """Return True if the cell is blocked."""
+        return self.maze.type[self.index] == CellType.BLOCKED
+
+    @property
+    def path(self) -> bool:
+        """Return True if the cell is part of the solution path."""
+        return self.maze.type[self.index] == CellType.PATH
+
+    @property
+    def entry(self) -> bool:
+        """Return True if the cell is the entry of the maze."""
+        return self.maze.type[self.index] == CellType.ENTRY
+
+    @property
+    def exit(self) -> bool:
+        """Return True if the cell is the exit of the maze."""
+        return self.maze.type[self.index] == CellType.EXIT
+
+    def set(
+            self,
+            west: Optional[bool] = None,
+            south: Optional[bool] = None,
+            east: Optional[bool] = None,
+            north: Optional[bool] = None,
+            type: Optional[CellType] = None
+    ) -> "Cell":
+        """Update one or more cell attributes.
+
+        Only the given attributes are written, directly to the maze planes.
+
+        Args:
+            west (Optional[bool]): New value of the west wall.
+            south (Optional[bool]): New value of the south wall.
+            east (Optional[bool]): New value of the east wall.
+            north (Optional[bool]): New value of the north wall.
+            type (Optional[CellType]): New type of the cell.
+
+        Returns:
+            Cell: The updated cell instance (allows method chaining).
+
+        Example:
+            >>> cell.set(north=False)
+            >>> cell.set(type=CellType.BLOCKED)
+        """
+        if west is not None:
+            self.update_wall(WEST, west)
+        if south is not None:
+            self.update_wall(SOUTH, south)
+        if east is not None:
+            self.update_wall(EAST, east)
+        if north is not None:
+            self.update_wall(NORTH, north)
+        if type is not None:
+            self.maze.type[self.index] = type
+        return self
+
+
+class Maze:
+    """Represent a 2D maze grid.
+
+    The maze stores its data as a structure of arrays: one byte plane for
+    the walls, packed as NORTH, EAST, SOUTH and WEST bits, and one for the
+    cell type. Each plane is a flat ``bytearray`` in row-major order, so
+    the cell (x, y) is found at index ``y * width + x`` of every plane. The
+    maze supports wall manipulation between adjacent cells and stores the
+    solution path.
+
+    Attributes:
+        walls (bytearray): Wall bits of each cell.
+        type (bytearray): CellType value of each cell.
+        width (int): Number of columns in the maze.
+        height (int): Number of rows in the maze.
+        path (List[Coordinate]): Solution path from entry to exit.
+    """
+    walls: bytearray
+    type: bytearray
+    width: int
+    height: int
+    path: List[Coordinate]
+
+    def __init__(self, width: int, height: int) -> None:
+        """Initialize a maze with given dimensions.
+
+        All cells are initialized as open with all four walls present.
+
+        Args:
+            width (int): Number of columns.
+            height (int): Number of rows.
+        """
+        self.width = width
+        self.height = height
+        self.walls = bytearray((ALL_WALLS,)) * (width * height)
+        self.type = bytearray(width * height)
+        self.path = []
+        self._grid: Optional[List[List[Cell]]] = None
+
+    @property
+    def grid(self) -> List[List[Cell]]:
+        """Return the maze as a 2D grid of cells indexed as [y][x].
+
+        The grid is built once on first access. Its cells are views on the
+        maze planes, so it always reflects the current state of the maze.
+
+        Returns:
+            List[List[Cell]]: 2D grid of cells.
+        """
+        if self._grid is None:
+            self._grid = [
+                [Cell.view(self, x, y) for x in range(self.width)]
+                for y in range(self.height)
+            ]
+        return self._grid
+
+    def get_all_coordinates(self) -> List[Coordinate]:
+        """Return all coordinates in the maze.
+
+        Returns:
+            List[Coordinate]: List of (x, y) coordinates.
+        """
+        return list(self.iter_coordinates())
+
+    def iter_coordinates(self) -> Iterator[Coordinate]:
+        """Iterate over all coordinates in the maze, row by row.
+
+        Unlike `get_all_coordinates`, no list is built, so callers that only
+        walk the maze once don't allocate all coordinates upfront.
+
+        Yields:
+            Coordinate: The (x, y) coordinates.
+        """
+        for y in range(self.height):
+            for x in range(self.width):
+                yield (x, y)
+
+    def get_cell(self, x: int, y: int) -> Cell:
+        """Return the cell at the given coordinates.
+
+        Args:
+            x (int): Column index.
+            y (int): Row index.
+
+        Returns:
+            Cell: A view on the corresponding cell.
+        """
+
+        return Cell.view(self, x, y)
+
+    def get_blocked_cells(self) -> List[Coordinate]:
+        """Return coordinates of all blocked cells.
+
+        The type plane is searched with `bytearray.find`, so the scan runs
+        in C and only blocked cells are visited in Python.
+
+        Returns:
+            List[Coordinate]: List of (x, y) coordinates
+                where the cell type is BLOCKED.
+        """
+        blocked = CellType.BLOCKED
+        cells: List[Coordinate] = []
+        index = self.type.find(blocked)
+        while index != -1:
+            cells.append((index % self.width, index // self.width))
+            index = self.type.find(blocked, index + 1)
+        return cells
+
+    def has_wall_between(
+            self,
+            previous_coordinate: Coordinate,
+            current_coordinate: Coordinate
+    ) -> bool:
+        """Check whether a wall exists between two adjacent cells.
+
+        Args:
+            previous_coordinate (Coordinate): First cell.
+            current_coordinate (Coordinate): Adjacent cell.
+
+        Returns:
+            bool: True if a wall exists between the cells.
+
+        Raises:
+            ValueError: If the cells are not orthogonally adjacent.
+        """
+        previous_x, previous_y = previous_coordinate
+        x, y = current_coordinate
+        dx = x - previous_x
+        dy = y - previous_y
+        if abs(dx) + abs(dy) != 1:
+            raise ValueError(
+                f"Cells ({previous_x}, {previous_y}) and ({x}, {y}) "
+                "are not adjacent"
+            )
+        bit = WALLS_BY_STEP[dy * 3 + dx + 4][0]
+        return self.walls[previous_y * self.width + previous_x] & bit != 0
+
+    def set_wall_at(
+        self,
+        previous_coordinate: Coordinate,
+        current_coordinate: Coordinate,
+        set_wall: bool
+    ) -> bool:
+        """Add or remove the wall between two adjacent cells.
+
+        Updates both cells symmetrically to maintain consistency. The walls
+        to update are picked from the same step-indexed table as `carve`.
+
+        Args:
+            previous_coordinate (Coordinate): First cell.
+            current_coordinate (Coordinate): Adjacent cell.
+            set_wall (bool): True to add a wall, False to remove it.
+
+        Returns:
+            bool: False if coordinates are identical,
+                True otherwise.
+
+        Raises:
+            ValueError: If distinct cells are not orthogonally adjacent.
+        """
+        if previous_coordinate == current_coordinate:
+            return False
+
+        previous_x, previous_y = previous_coordinate
+        x, y = current_coordinate
+        dx = x - previous_x
+        dy = y - previous_y
+        if abs(dx) + abs(dy) != 1:
+            raise ValueError(
+                f"Cells ({previous_x}, {previous_y}) and ({x}, {y}) "
+                "are not adjacent"
+            )
+        previous_index = previous_y * self.width + previous_x
+        index = y * self.width + x
+        previous_bit, bit = WALLS_BY_STEP[dy * 3 + dx + 4]
+
+        if set_wall:
+            self.walls[index] |= bit
+            self.walls[previous_index] |= previous_bit
+        else:
+            self.walls[index] &= ~bit
+            self.walls[previous_index] &= ~previous_bit
+
+        return True
+
+    def carve(self, x1: int, y1: int, x2: int, y2: int) -> None:
+        """Remove the wall between two adjacent cells.
+
+        The walls to knock down are picked from a lookup table indexed by
+        the step between both cells, so no direction test is needed.
+
+        Args:
+            x1 (int): Column index of the first cell.
+            y1 (int): Row index of the first cell.
+            x2 (int): Column index of the adjacent cell.
+            y2 (int): Row index of the adjacent cell.
+
+        Raises:
+            ValueError: If the cells are not adjacent.
+        """
+        dx = x2 - x1
+        dy = y2 - y1
+        if abs(dx) + abs(dy) != 1:
+            raise ValueError(
+                f"Cells ({x1}, {y1}) and ({x2}, {y2}) are not adjacent"
+            )
+        first, second = WALLS_BY_STEP[dy * 3 + dx + 4]
+        self.walls[y1 * self.width + x1] &= ~first
+        self.walls[y2 * self.width + x2] &= ~second
+
+    def copy_from(self, source: "Maze", offset_x: int, offset_y: int) -> None:
+        """Copy cell data from source maze.
+
+        Cells from the source maze are copied starting at the specified offset.
+        Each source row is copied with a single slice assignment per plane.
+
+        Args:
+            source (Maze): The maze to copy from.
+            offset_x (int): Horizontal offset in target maze.
+            offset_y (int): Vertical offset in target maze.
+        """
+        planes = ((self.walls, source.walls), (self.type, source.type))
+        for y in range(source.height):
+            start = (offset_y + y) * self.width + offset_x
+            source_start = y * source.width
+            for plane, source_plane in planes:
+                plane[start:start + source.width] = source_plane[
+                    source_start:source_start + source.width
+                ]
+
+    def set_path(self, path: List[Coordinate]) -> None:
+        """Store the solution path.
+
+        Args:
+            path (List[Coordinate]): Ordered list of path coordinates.
+        """
+        self.path = path
+
+    def get_path(self) -> List[Coordinate]:
+        """Return the stored solution path.
+
+        Returns:
+            List[Coordinate]: Ordered path from entry to exit.
+        """
+        return self.path
@@ -0,0 +1,37 @@
+"""
+Mini '42' maze pattern.
+
+This file contains a predefined small maze with the "42" pattern. It is used
+by the MazeGenerator to copy the pattern into the middle of larger mazes.
+
+The pattern is represented as a Maze object (or a 2D list of Cell instances)
+with all walls and cell types initialized to what is shown below. The cell
+types are written into the type plane of the maze in one go, straight from
+the text pattern. The coordinates of its blocked cells are computed once, at
+import, in `blocked_42`.
+
+Example usage:
+    from maze_42 import maze_42
+    maze.copy_from(maze_42, x, y)
+"""
+from .maze import Maze, CellType, Coordinate
+
+
+# "X" marks the blocked cells of the pattern, "." the open ones.
+PATTERN_42 = (
+    "X.X.XXX",
+    "X.X...X",
+    "XXX.XXX",
+    "..X.X..",
+    "..X.XXX",
+)
+
+maze_42 = Maze(len(PATTERN_42[0]), len(PATTERN_42))
+maze_42.type[:] = bytes(
+    CellType.BLOCKED if char == "X" else CellType.OPEN
+    for row in PATTERN_42
+    for char in row
+)
+
+# Blocked cells of the pattern, relative to its top left corner.
+blocked_42: tuple[Coordinate, ...] = tuple(maze_42.get_blocked_cells())
@@ -0,0 +1,438 @@
+from typing import Any, Callable, Iterator, List, Sequence, Set
+from itertools import compress, permutations, product
+from operator import itemgetter
+from random import Random
+from sys import stderr
+from .config_parser import Config
+from .errors import EntryExitInFTError
+from .maze import CellType, Maze, Coordinate, NORTH, EAST, SOUTH, WEST
+from .maze_42 import maze_42, blocked_42
+
+# For each number of neighbors from 2 to 4, a getter returning them in each
+# possible order, so a random order costs a single random number.
+NEIGHBOR_ORDERS: tuple[tuple[Callable[[Sequence[Any]], Any], ...], ...] = (
+    (), (), *(
+        tuple(itemgetter(*order) for order in permutations(range(count)))
+        for count in range(2, 5)
+    )
+)
+
+
+class MazeGenerator:
+    """Generate a maze based on a configuration and solve it.
+
+    The generator creates a fully closed maze. Depending on the size, it embeds
+    a fixed "42" pattern. The generator carves the walls using depth-first
+    search (DFS) algorithm and, optionally, removes additional walls to make
+    the maze imperfect. Finally, it computes a path from entry to exit using
+    breadth-first search (BFS) algorithm.
+
+    Attributes:
+        visited (Set[Coordinate]): Coordinates visited at certain point.
+        maze (Maze): The maze data structure being generated.
+        blocked_cells (List[Coordinate]): Cells of the "42" pattern drawn
+            into the maze, empty if the maze is too small for it.
+        config (Config): Configuration object controlling generation.
+        random (Random): Source of the random numbers of the mazes, seeded
+            from the configuration. Generators don't share the state of the
+            global `random` module, so they can run side by side.
+        neighbors (List[List[tuple[Coordinate, ...]]]): For each cell,
+            indexed by row then column, its neighbors inside the maze in
+            north, west, south, east order.
+        forward_neighbors (List[List[tuple[Coordinate, ...]]]): For each
+            cell, only its south and east neighbors inside the maze.
+    """
+    visited: Set[Coordinate]
+    maze: Maze
+    blocked_cells: List[Coordinate]
+    random: Random
+    neighbors: List[List[tuple[Coordinate, ...]]]
+    forward_neighbors: List[List[tuple[Coordinate, ...]]]
+
+    def __init__(self, config: Config) -> None:
+        """Initialize the maze generator.
+
+        Args:
+            config (Config): Configuration data containing (at least) maze
+                dimensions, entry/exit coordinates and generation options.
+
+        Example:
+            >>> generator = MazeGenerator(config)
+            >>> maze = generator.create_maze()
+        """
+        self.config = config
+        self.visited = set()
+        self.maze = Maze(0, 0)
+        self.blocked_cells = []
+        self.build_neighbors()
+        self.random = Random(
+            1 if self.config.seed is None else self.config.seed
+        )
+
+    def build_neighbors(self) -> None:
+        """Compute the neighbors of every cell once for all mazes.
+
+        All mazes of the generator have the size of the configuration, so
+        the bounds of the neighbors are checked here only, instead of on
+        every call of `get_unvisited_neighbors`.
+        """
+        width = self.config.width
+        height = self.config.height
+        self.neighbors = [
+            [
+                tuple(
+                    (nx, ny)
+                    for nx, ny in (
+                        (x, y - 1), (x - 1, y), (x, y + 1), (x + 1, y)
+                    )
+                    if 0 <= nx < width and 0 <= ny < height
+                )
+                for x in range(width)
+            ]
+            for y in range(height)
+        ]
+        self.forward_neighbors = [
+            [
+                tuple((nx, ny) for nx, ny in cell if nx > x or ny > y)
+                for x, cell in enumerate(row)
+            ]
+            for y, row in enumerate(self.neighbors)
+        ]
+
+    def create_maze(self) -> Maze:
+        """Generate a complete maze.
+
+        First fully closed maze grid is created. Then, the "42" pattern is
+        added in the center, if possible. The passages are carved and
+        additional walls get removed, if the maze is imperfect. Finally, the
+        shortest solution path is determined.
+
+        Returns:
+            Maze: The generated maze instance.
+
+        Raises:
+            EntryExitInFTError: If the configured entry or exit coordinates are
+                inside the fixed "42" pattern.
+        """
+        self.maze = Maze(self.config.width, self.config.height)
+        self.draw_42()
+        self.visited = set(self.blocked_cells)
+        if (
+            self.config.entry in self.visited or
+            self.config.exit in self.visited
+        ):
+            raise EntryExitInFTError(self.blocked_cells)
+        self.carve_maze()
+        if not self.config.perfect:
+            self.make_imperfect()
+        self.solve_maze()
+        return self.maze
+
+    def draw_42(self) -> None:
+        """Embed the "42" pattern into the maze.
+
+        If the maze size allows, the pattern is copied from a predefined
+        mini-maze and placed in the center of the current maze grid. Otherwise,
+        the method exists without modifying the maze.
+
+        The blocked cells are known from the pattern and its position, so
+        they are saved in `blocked_cells` instead of scanning the whole
+        maze for them afterwards. The pattern's own blocked cells come from
+        `blocked_42`, computed once at import.
+        """
+        self.blocked_cells = []
+        if (
+            self.maze.width < maze_42.width + 2 or
+            self.maze.height < maze_42.height + 2
+        ):
+            print("Maze size doesn't allow drawing '42' pattern.", file=stderr)
+            return
+        x = (self.maze.width - maze_42.width) // 2
+        y = (self.maze.height - maze_42.height) // 2
+        self.maze.copy_from(maze_42, x, y)
+        self.blocked_cells = [
+            (x + blocked_x, y + blocked_y)
+            for blocked_x, blocked_y in blocked_42
+        ]
+
+    def carve_maze(self) -> None:
+        """Carve the maze using depth-first search (DFS) algorithm.
+
+        Starting from the entry point, the algorithm visits
+        neighboring unvisited cells and removes walls between them.
+        When reaching a dead end, it backtracks using a stack-based
+        approach until all reachable cells are visited.
+
+        The search works directly on the wall plane of the maze with flat
+        cell indices and a byte map of visited cells, so no coordinate
+        tuples or cell objects are created in the loop. It is iterative:
+        the stack holds one iterator per cell of the current branch, over
+        its shuffled neighbors, so backtracking resumes the iteration
+        where it stopped instead of re-pushing every neighbor. Each
+        neighbor entry holds the bits of the two walls separating it from
+        the cell it is reached from.
+
+        Rather than shuffling the neighbors, one of their possible orders
+        is picked from `NEIGHBOR_ORDERS` with a single random number. Once
+        the search is done, the carved cells are added to `visited`.
+        """
+        width = self.config.width
+        height = self.config.height
+        walls = self.maze.walls
+        chance = self.random.random
+        north_walls = (NORTH, SOUTH)
+        south_walls = (SOUTH, NORTH)
+        east_walls = (EAST, WEST)
+        west_walls = (WEST, EAST)
+
+        visited = bytearray(width * height)
+        for x, y in self.visited:
+            visited[y * width + x] = 1
+
+        entry = self.config.entry[1] * width + self.config.entry[0]
+        step: tuple[int, int, tuple[int, ...]] = (entry, entry, ())
+        stack: List[Iterator[tuple[int, int, tuple[int, ...]]]] = []
+
+        while True:
+            previous, current, bits = step
+            visited[current] = 1
+            if bits:
+                walls[previous] &= ~bits[0]
+                walls[current] &= ~bits[1]
+
+            y, x = divmod(current, width)
+            neighbors: List[tuple[int, int, tuple[int, ...]]] = []
+            if y > 0 and not visited[current - width]:
+                neighbors.append((current, current - width, north_walls))
+            if x > 0 and not visited[current - 1]:
+                neighbors.append((current, current - 1, west_walls))
+            if y < height - 1 and not visited[current + width]:
+                neighbors.append((current, current + width, south_walls))
+            if x < width - 1 and not visited[current + 1]:
+                neighbors.append((current, current + 1, east_walls))
+            if len(neighbors) > 1:
+                orders = NEIGHBOR_ORDERS[len(neighbors)]
+                neighbors = orders[int(chance() * len(orders))](neighbors)
+            stack.append(iter(neighbors))
+
+            # Backtrack until a cell of the branch has an unvisited neighbor
+            while stack:
+                for step in stack[-1]:
+                    if not visited[step[1]]:
+                        break
+                else:
+                    stack.pop()
+                    continue
+                break
+            else:
+                break
+
+        # Carved cells are recorded in the visited set, as they always were
+        self.visited.update(
+            (x, y)
+            for y, x in compress(product(range(height), range(width)), visited)
+        )
+
+    def get_unvisited_neighbors(
+            self, coordinate: Coordinate, bottom_and_right_only: bool = False
+    ) -> List[Coordinate]:
+        """Return unvisited neighboring cells.
+
+        Args:
+            coordinate (Coordinate): The current cell (x, y).
+            bottom_and_right_only (bool, optional): If True, only
+                considers south and east neighbors. Defaults to False.
+
+        Returns:
+            List[Coordinate]: The valid unvisited neighbors, in random
+                order. The current cell is known by the caller, so it isn't
+                repeated with each of them.
+
+        Note:
+            Up to mazegen 1.0.0 this returned (current_cell, neighbor_cell)
+            pairs. Callers unpacking pairs must now take the neighbor
+            directly; the current cell is the `coordinate` argument.
+        """
+        x, y = coordinate
+        if bottom_and_right_only:
+            cells = self.forward_neighbors[y][x]
+        else:
+            cells = self.neighbors[y][x]
+        visited = self.visited
+        result = [neighbor for neighbor in cells if neighbor not in visited]
+        if len(result) > 1:
+            orders = NEIGHBOR_ORDERS[len(result)]
+            result = list(
+                orders[int(self.random.random() * len(orders))](result)
+            )
+        return result
+
+    def make_imperfect(self) -> None:
+        """Remove additional walls to make the maze imperfect.
+
+        Iterates over all cells and randomly removes walls between
+        adjacent cells (right and bottom only) with a fixed probability of 10%,
+        making sure that doing so does not create invalid 2x3 or 3x2 open
+        regions.
+        """
+        self.visited = set(self.blocked_cells)
+        chance = self.random.random
+
+        for coordinate in self.maze.iter_coordinates():
+            if coordinate in self.visited:
+                continue
+            for neighbor in self.get_unvisited_neighbors(coordinate, True):
+                if (
+                    self.maze.has_wall_between(coordinate, neighbor)
+                    and chance() < 0.1
+                ):
+                    self.remove_wall_if_valid(coordinate, neighbor)
+
+    def solve_maze(self) -> None:
+        """Find and save the shortest path from entry to exit.
+
+        Performs breadth-first search (BFS) to compute the shortest
+        path from the configured entry to the exit. The resulting path
+        is stored.
+
+        The search runs from both ends at once: each round expands a whole
+        level of the smaller of the two frontiers, until a cell reached
+        from one end is reached from the other. The two partial paths then
+        form the shortest path, and only about half as deep a region
+        around each end is explored as with a single search. As whole
+        levels are expanded, all the cells where the searches first meet
+        give paths of the same length, so the first one found is kept.
+
+        Like the carving, the search works on flat cell indices and reads
+        the wall bits directly. The outer walls of the maze and the walls
+        of the blocked cells are never removed, so following open walls
+        never leaves the maze nor enters the "42" pattern, and no bounds
+        checks are needed.
+        """
+        width = self.config.width
+        size = width * self.config.height
+        walls = self.maze.walls
+        entry = self.config.entry[1] * width + self.config.entry[0]
+        exit = self.config.exit[1] * width + self.config.exit[0]
+        steps = ((NORTH, -width), (WEST, -1), (SOUTH, width), (EAST, 1))
+
+        # For the search from the entry and the one from the exit: the cell
+        # each explored cell was reached from, -1 if not explored yet.
+        parents = ([-1] * size, [-1] * size)
+        parents[0][entry] = entry
+        parents[1][exit] = exit
+        frontiers = [[entry], [exit]]
+
+        meeting = entry if entry == exit else -1
+        while meeting == -1 and frontiers[0] and frontiers[1]:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            own_parents = parents[side]
+            other_parents = parents[1 - side]
+            next_frontier: List[int] = []
+            for current in frontiers[side]:
+                cell_walls = walls[current]
+                for bit, step in steps:
+                    neighbor = current + step
+                    if not cell_walls & bit and own_parents[neighbor] == -1:
+                        own_parents[neighbor] = current
+                        if other_parents[neighbor] != -1:
+                            meeting = neighbor
+                            break
+                        next_frontier.append(neighbor)
+                else:
+                    continue
+                break
+            frontiers[side] = next_frontier
+
+        if meeting == -1:
+            path_cells = [exit]
+        else:
+            path_cells = [meeting]
+            while path_cells[-1] != entry:
+                path_cells.append(parents[0][path_cells[-1]])
+            path_cells.reverse()
+            while path_cells[-1] != exit:
+                path_cells.append(parents[1][path_cells[-1]])
+
+        cell_types = self.maze.type
+        path: List[Coordinate] = []
+        for cell in path_cells:
+            cell_types[cell] = CellType.PATH
+            path.append((cell % width, cell // width))
+
+        self.maze.set_path(path)
+        cell_types[entry] = CellType.ENTRY
+        cell_types[exit] = CellType.EXIT
+
+    def remove_wall_if_valid(
+            self, prev_coordinate: Coordinate, curr_coordinate: Coordinate
+    ) -> None:
+        """Remove a wall if by doing it no invalid square regions are created.
+
+        Temporarily removes the wall between two adjacent cells and checks
+        whether this creates a fully open 3x3 region. If such a region is
+        detected, the wall is restored.
+
+        A 3x3 square is fully open when none of its inner walls is set:
+        the east walls of its two left columns and the south walls of its
+        two top rows. They are tested with a few bitwise ORs on the wall
+        plane, without building the cells of the square.
+
+        Args:
+            prev_coordinate (Coordinate): First cell.
+            curr_coordinate (Coordinate): Adjacent cell.
+        """
+        self.maze.set_wall_at(prev_coordinate, curr_coordinate, False)
+        width = self.config.width
+        walls = self.maze.walls
+
+        for x, y in self.get_invalid_size_squares(
+            (prev_coordinate, curr_coordinate)
+        ):
+            top = y * width + x
+            middle = top + width
+            bottom = middle + width
+            if not (
+                (walls[top] | walls[top + 1] | walls[middle] |
+                 walls[middle + 1]) & (EAST | SOUTH)
+                or (walls[top + 2] | walls[middle + 2]) & SOUTH
+                or (walls[bottom] | walls[bottom + 1]) & EAST
+            ):
+                self.maze.set_wall_at(prev_coordinate, curr_coordinate, True)
+                break
+
+    def get_invalid_size_squares(
+            self, adj_cells: tuple[Coordinate, Coordinate]
+    ) -> List[Coordinate]:
+        """Return all 3x3 squares that include the given adjacent cells.
+
+        Computes every possible 3x3 region in the maze that contains
+        both provided adjacent cells. Squares that don't contain the
+        removed wall can't have become fully open, so they aren't checked.
+
+        Args:
+            adj_cells (tuple[Coordinate, Coordinate]): Two adjacent cells.
+
+        Returns:
+            List[Coordinate]: A list of 3x3 squares, where each square is
+                represented by the coordinates of its top-left cell.
+
+        Note:
+            Up to mazegen 1.0.0 each square was returned as the list of
+            its nine coordinates, and squares starting up to four cells
+            before the given ones were included, although they can't
+            contain both cells. The nine coordinates of a square with
+            top-left corner (x, y) are (x + dx, y + dy) for dx and dy in
+            range(3).
+        """
+        min_x = max(0, max(row for row, _ in adj_cells) - 2)
+        max_x = min(self.config.width - 3, min(row for row, _ in adj_cells))
+
+        min_y = max(0, max(col for _, col in adj_cells) - 2)
+        max_y = min(self.config.height - 3, min(col for _, col in adj_cells))
+
+        return [
+            (row, col)
+            for col in range(min_y, max_y + 1)
+            for row in range(min_x, max_x + 1)
+        ]
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 # from maze import Cell
 # from typing import TYPE_CHECKING
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Dict
-from render_maze import RenderMaze, RenderMazeGenerator, RCell
+from typing import Deque, List, Dict, Optional
+import sys
+from render_maze import RenderMaze, RenderMazeGenerator, RCell, RCellType
 from mazegen import Maze
 
 # if TYPE_CHECKING:
@@ -18,8 +20,8 @@ class AsciiKit:
     and box-drawing characters (corners, horizontal, vertical lines)
     used to render the maze in the terminal.
     """
-    foreground_colour_list: List[str]
-    background_colour_list: List[str]
+    foreground_colour_list: Deque[str]
+    background_colour_list: Deque[str]
 
     # Box drawing characters (class-level constants)
     HOR: str = "━"
@@ -79,11 +81,12 @@ class AsciiPrinter:
     of the colour lists for varied output.
 
     Attributes:
-        foreground_colours (List[str]): List of ANSI codes for foreground
-            colours.
-        background_colours (List[str]): List of ANSI codes for background
-            colours.
+        foreground_colours (Deque[str]): ANSI codes for foreground colours.
+        background_colours (Deque[str]): ANSI codes for background colours.
         include_path (bool): Whether to render the shortest path in the maze.
+        render_strings (Optional[Dict[tuple[str, str], str]]): Render strings
+            for the current colours, built on first use and dropped when the
+            colours rotate.
 
     Methods:
 
@@ -92,18 +95,19 @@ class AsciiPrinter:
     def __init__(self) -> None:
         """Initializes the ASCII printer with default colours and path
             visibility."""
-        self.foreground_colours: List[str] = [
+        self.foreground_colours: Deque[str] = deque([
             "\033[37m",  # white
             "\033[33m",  # yellow
             "\033[36m",  # cyan
-        ]
-        self.background_colours: List[str] = [
+        ])
+        self.background_colours: Deque[str] = deque([
             "\033[44m",  # blue
             "\033[45m",  # magenta
             "\033[42m",  # green
             "\033[41m",  # red
-        ]
+        ])
         self.include_path: bool = False
+        self.render_strings: Optional[Dict[tuple[str, str], str]] = None
 
     @staticmethod
     def render_str(kit: AsciiKit) -> Dict[tuple[str, str], str]:
@@ -167,7 +171,8 @@ class AsciiPrinter:
         This key is used by `render_str` to determine the correct ASCII
         character and colour for the cell. It accounts for horizontal,
         vertical, center, and corner cells, and optionally includes the path
-        if `include_path` is enabled.
+        if `include_path` is enabled. The structural type is read once and
+        compared by identity, instead of going through one property per type.
 
         Args:
             cell (RCell): The rendered cell whose type and state are to be
@@ -178,7 +183,8 @@ class AsciiPrinter:
             key for ASCII rendering, e.g., `("hor", "wall")` or
             `("corner", "tl")`.
         """
-        if cell.horizontal:
+        cell_type: RCellType = cell.type
+        if cell_type is RCellType.HORIZONTAL:
             if cell.blocked:
                 return ("hor", "blocked")
             elif cell.path:
@@ -191,7 +197,7 @@ class AsciiPrinter:
             else:
                 return ("hor", "wall")
 
-        elif cell.vertical:
+        elif cell_type is RCellType.VERTICAL:
             if cell.blocked:
                 return ("ver", "blocked")
             elif cell.path:
@@ -204,7 +210,7 @@ class AsciiPrinter:
             else:
                 return ("ver", "wall")
 
-        elif cell.center:
+        elif cell_type is RCellType.CENTER:
             if cell.blocked:
                 return ("center", "blocked")
             elif cell.path:
@@ -227,14 +233,10 @@ class AsciiPrinter:
         return ("corner", corner_type)
 
     def rotate_colours(self) -> None:
-        """Rotates colour list to the left"""
-        self.foreground_colours = self.foreground_colours[
-            1:] + self.foreground_colours[:1]
-
-        self.background_colours = self.background_colours[
-            1:] + self.background_colours[:1]
-        # self.colours[1:] → everything except the first element
-        # self.colours[:1] → the first element
+        """Rotates colour list to the left, in place"""
+        self.foreground_colours.rotate(-1)
+        self.background_colours.rotate(-1)
+        self.render_strings = None
 
     def toggle_path(self) -> None:
         """Toggles the visibility of the shortest path in the ASCII maze.
@@ -242,6 +244,22 @@ class AsciiPrinter:
         """
         self.include_path = not self.include_path
 
+    def get_render_strings(self) -> Dict[tuple[str, str], str]:
+        """Returns the render strings for the current colours.
+
+        The strings only depend on the colours, so they are built with a new
+        `AsciiKit` the first time they are needed after a colour rotation,
+        and reused by every following print.
+
+        Returns:
+            Dict[tuple[str, str], str]: The mapping built by `render_str`.
+        """
+        if self.render_strings is None:
+            kit: AsciiKit = AsciiKit(
+                self.foreground_colours, self.background_colours)
+            self.render_strings = self.render_str(kit)
+        return self.render_strings
+
     def print_maze(self, maze: "Maze") -> None:
         """Renders a Maze object as ASCII output in the terminal.
 
@@ -250,17 +268,30 @@ class AsciiPrinter:
         prints the maze row by row. Uses the foreground and background colours
         defined in the printer, and respects the `include_path` setting.
 
+        Each row is assembled with a single `str.join` over its render strings
+        and the whole maze is written to stdout with one call, instead of
+        printing every cell separately. The render strings are cached between
+        prints, see `get_render_strings`, and each shared RCell (see
+        `RenderMazeGenerator.get_rcell`) is converted to its string only once
+        per print, so the rows are joined without any Python-level loop.
+
         Args:
             maze (Maze): The logical Maze object to render.
         """
-        kit: AsciiKit = AsciiKit(
-            self.foreground_colours, self.background_colours)
         r_maze_generator: RenderMazeGenerator = RenderMazeGenerator()
         r_maze: RenderMaze = r_maze_generator.create(maze)
-        output_dict: Dict[tuple[str, str], str] = self.render_str(kit)
-
-        for row in r_maze.grid:
-            for cell in row:
-                key: tuple[str, str] = self.cell_to_key(cell)
-                print(output_dict.get(key, "X"), end="")
-            print()
+        render = self.get_render_strings().get
+        cell_to_key = self.cell_to_key
+        # The render maze is made only of the generator's shared RCells, so
+        # each of them is converted once and the rows look the strings up by
+        # value, with the iteration done by `map` and `str.join`
+        strings: Dict[RCell, str] = {
+            rcell: render(cell_to_key(rcell), "X")
+            for rcell in r_maze_generator.rcells.values()
+        }
+        lines: List[str] = [
+            "".join(map(strings.__getitem__, row))
+            for row in r_maze.grid
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
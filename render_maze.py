@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
-from typing import List, Any
-from enum import Enum
+from typing import Dict, List, Any
+from enum import IntEnum, StrEnum
 from dataclasses import dataclass
 from mazegen import Maze, Cell
 
@@ -11,7 +11,7 @@ from mazegen import Maze, Cell
 # type Coordinate = tuple[int, int]
 
 
-class RCellType(Enum):
+class RCellType(IntEnum):
     """Enumeration of render cell types in the rendered maze.
 
     This enum defines the structural role of an RCell in the rendered maze
@@ -23,6 +23,9 @@ class RCellType(Enum):
         HORIZONTAL: A horizontal wall segment.
         CENTER: The interior (center) of a maze cell.
         CORNER: A junction or corner between wall segments.
+
+    Being an IntEnum, members hash and compare as plain ints, which keeps
+    the RCell lookups of the render hot path cheap.
     """
     VERTICAL = 0
     HORIZONTAL = 1
@@ -30,12 +33,13 @@ class RCellType(Enum):
     CORNER = 3
 
 
-class CornerType(Enum):
+class CornerType(StrEnum):
     """Enumeration of corner and junction shapes for rendered maze cells.
 
     This enum describes the exact box-drawing shape that should be printed
     for an RCell of type CORNER. The value of each enum member is used
-    directly as a lookup key in the ASCII rendering map.
+    directly as a lookup key in the ASCII rendering map. Being a StrEnum,
+    members hash and compare as plain strings.
 
     The corner type is determined during render-maze generation based on
     surrounding wall connections.
@@ -54,7 +58,17 @@ class CornerType(Enum):
     NONE = ""            # not a corner
 
 
-@dataclass
+# Corner shape between four cells, indexed by the walls meeting there:
+# col.north << 3 | prev.north << 2 | col.west << 1 | top.west
+CORNER_TYPES: tuple[CornerType, ...] = (
+    CornerType.NONE, CornerType.NONE, CornerType.NONE, CornerType.VER,
+    CornerType.NONE, CornerType.BR, CornerType.TR, CornerType.T_LEFT,
+    CornerType.NONE, CornerType.BL, CornerType.TL, CornerType.T_RIGHT,
+    CornerType.HOR, CornerType.T_UP, CornerType.T_DOWN, CornerType.CROSS,
+)
+
+
+@dataclass(frozen=True, slots=True)
 class RCell:
     """Represents a single rendered cell in the ASCII maze grid.
 
@@ -70,6 +84,13 @@ class RCell:
     RCell instances are created by RenderMazeGenerator and later consumed
     by the ASCII printer to determine which characters and colours to output.
 
+    A render maze holds four RCells per maze cell, so the class is slotted:
+    instances carry no `__dict__`. RCells are frozen and hashable: the
+    RCells of a render maze are shared between the positions rendered the
+    same way (see `RenderMazeGenerator.get_rcell`), and the printer looks
+    their render strings up by value. A different cell is made with
+    `dataclasses.replace` or `get_rcell`.
+
     Attributes:
         blocked: True if this rendered cell represents a blocked area.
         path: True if this rendered cell is part of the solution path.
@@ -94,7 +115,7 @@ class RCell:
         Returns:
             True if the cell type is RCellType.VERTICAL, False otherwise.
         """
-        return self.type == RCellType.VERTICAL
+        return self.type is RCellType.VERTICAL
 
     @property
     def horizontal(self) -> bool:
@@ -103,7 +124,7 @@ class RCell:
             bool: True if the cell type is RCellType.HORIZONTAL,
             False otherwise.
         """
-        return self.type == RCellType.HORIZONTAL
+        return self.type is RCellType.HORIZONTAL
 
     @property
     def center(self) -> bool:
@@ -111,7 +132,7 @@ class RCell:
         Returns:
             bool: True if the cell type is RCellType.CENTER, False otherwise.
         """
-        return self.type == RCellType.CENTER
+        return self.type is RCellType.CENTER
 
     @property
     def corner(self) -> bool:
@@ -119,19 +140,7 @@ class RCell:
         Returns:
             bool: True if the cell type is RCellType.CORNER, False otherwise.
         """
-        return self.type == RCellType.CORNER
-
-    # ** -> Collect all keyword arguments (kwargs) passed to this
-    # function into a dictionary: can be more than one key value pair
-    def set(self, **kwargs: Any) -> "RCell":
-        """ Sets the cell properties.
-        For example:
-        - cell.set(path=True)
-        - cell.set(type=CellType.VERTICAL)
-        """
-        for key, value in kwargs.items():
-            self.__setattr__(key, value)
-        return self
+        return self.type is RCellType.CORNER
 
 
 class RenderMaze:
@@ -154,13 +163,10 @@ class RenderMaze:
         """
         self.width = (maze.width * 2) + 1
         self.height = (maze.height * 2) + 1
-        self.grid = []
-
-        for _ in range(self.height):
-            row = []
-            for _ in range(self.width):
-                row.append(RCell())
-            self.grid.append(row)
+        # Every position starts on the same blank RCell, until the generator
+        # replaces it with the shared RCell it renders to
+        blank: RCell = RCell()
+        self.grid = [[blank] * self.width for _ in range(self.height)]
 
 
 class RenderMazeGenerator:
@@ -169,13 +175,15 @@ class RenderMazeGenerator:
     This class provides methods to convert a logical maze into a
     rendered grid of RCells suitable for ASCII or graphical output.
     It handles splitting each logical cell into corners, walls, and
-    center cells, and allows access to neighboring cells.
+    center cells.
+
+    Attributes:
+        rcells (Dict[tuple[Any, ...], RCell]): The shared RCells created so
+            far by this generator, by field values.
 
     Methods:
-        get_top_cell(row, col, maze): Returns the maze cell immediately above
-            the given position, or None if at the top row.
-        get_prev_cell(row, col, maze): Returns the maze cell immediately to the
-            left of the given position, or None if at the leftmost column.
+        get_rcell(type, corner_type, ...): Returns the shared RCell with
+            the given fields.
         set_corner(col, top, prev): Creates a corner RCell and assigns its
             corner type based on neighboring cells.
         set_last_col_corner(col): Generates the appropriate corner RCell for
@@ -186,49 +194,66 @@ class RenderMazeGenerator:
             cell to the left.
         set_center(col): Generates a center RCell reflecting the logical state
             of the maze cell.
-        set_last_row(c, maze): Generates the correct RCell for a specific
-            column in the last row of the maze.
+        set_last_row(c, col): Generates the corner and horizontal wall
+            RCells below a cell of the last maze row.
         create(maze): Builds a complete RenderMaze by converting all logical
             Cells into RCells.
     """
 
-    @staticmethod
-    def get_top_cell(row: int, col: int, maze: "Maze") -> Cell | None:
-        """Return the cell immediately above a given position.
+    rcells: Dict[tuple[Any, ...], RCell]
+
+    def __init__(self) -> None:
+        """Initializes the generator with no RCell created yet."""
+        # RCells shared by every position rendered the same way, by fields
+        self.rcells = {}
+
+    def get_rcell(
+            self,
+            type: RCellType,
+            corner_type: CornerType = CornerType.NONE,
+            blocked: bool = False,
+            path: bool = False,
+            entry: bool = False,
+            exit: bool = False,
+            open: bool = False
+    ) -> RCell:
+        """Return the shared RCell with the given fields.
+
+        A render maze only contains a few dozen distinct RCells, so each one
+        is created once and shared by all the positions rendered the same
+        way (flyweight), instead of allocating one RCell per position. RCells
+        are frozen, so sharing them is safe. The cells are kept by the
+        generator, so they live as long as it does.
 
         Args:
-            row (int): Row index of the current cell.
-            col (int): Column index of the current cell.
-            maze (Maze): Maze object containing the grid.
+            type (RCellType): The structural type of the cell.
+            corner_type (CornerType): The corner shape, if any.
+            blocked (bool): Whether the cell is part of the "42" pattern.
+            path (bool): Whether the cell is part of the solution path.
+            entry (bool): Whether the cell is the maze entry.
+            exit (bool): Whether the cell is the maze exit.
+            open (bool): Whether the cell is an open passage.
 
         Returns:
-            Cell | None: The cell above, or None if topmost row.
+            RCell: The shared cell.
         """
-        if row > 0:
-            return maze.grid[row - 1][col]
-        return None
-
-    @staticmethod
-    def get_prev_cell(row: int, col: int, maze: "Maze") -> Cell | None:
-        """Return the cell immediately to the left of a given position.
-
-        Args:
-            row (int): Row index of the current cell.
-            col (int): Column index of the current cell.
-            maze (Maze): Maze object containing the grid.
-
-        Returns:
-            Cell | None: The cell to the left, or None if leftmost column.
-        """
-        if col > 0:
-            return maze.grid[row][col - 1]
-        return None
+        key = (type, corner_type, blocked, path, entry, exit, open)
+        rcell = self.rcells.get(key)
+        if rcell is None:
+            rcell = RCell(blocked, path, entry, exit, open, type, corner_type)
+            self.rcells[key] = rcell
+        return rcell
 
-    @staticmethod
-    def set_corner(col: Cell, top: Cell | None, prev: Cell | None) -> RCell:
+    def set_corner(
+            self, col: Cell, top: Cell | None, prev: Cell | None
+    ) -> RCell:
         """Create a corner RCell and determine its corner type based on
             neighbors.
 
+        Inside the maze, the corner type is looked up in `CORNER_TYPES` from
+        the four walls meeting at the corner, instead of walking a cascade
+        of conditions.
+
         Args:
             col (Cell): The current maze cell.
             top (Cell | None): The cell above, if any.
@@ -237,55 +262,26 @@ class RenderMazeGenerator:
         Returns:
             RCell: The rendered corner cell.
         """
-        rcell: RCell = RCell()
-        rcell.set(type=RCellType.CORNER)
         if top is None:
             if prev is None:
-                rcell.set(corner_type=CornerType.TL)
-            elif prev.east is True:
-                rcell.set(corner_type=CornerType.T_DOWN)
-            else:
-                rcell.set(corner_type=CornerType.HOR)
-            return rcell
-        if prev is None:
-            if col.north is True:
-                rcell.set(corner_type=CornerType.T_RIGHT)
+                corner_type = CornerType.TL
+            elif prev.east:
+                corner_type = CornerType.T_DOWN
             else:
-                rcell.set(corner_type=CornerType.VER)
-            return rcell
-        if col.north is True:
-            if prev.north is False:
-                if col.west is True and top.west is True:
-                    rcell.set(corner_type=CornerType.T_RIGHT)
-                elif col.west is True and top.west is False:
-                    rcell.set(corner_type=CornerType.TL)
-                elif col.west is False and top.west is True:
-                    rcell.set(corner_type=CornerType.BL)
+                corner_type = CornerType.HOR
+        elif prev is None:
+            if col.north:
+                corner_type = CornerType.T_RIGHT
             else:
-                if col.west is False and top.west is False:
-                    rcell.set(corner_type=CornerType.HOR)
-                elif col.west is True and top.west is True:
-                    rcell.set(corner_type=CornerType.CROSS)
-                elif col.west is True and top.west is False:
-                    rcell.set(corner_type=CornerType.T_DOWN)
-                elif col.west is False and top.west is True:
-                    rcell.set(corner_type=CornerType.T_UP)
-
+                corner_type = CornerType.VER
         else:
-            if prev.north is True:
-                if col.west is True and top.west is True:
-                    rcell.set(corner_type=CornerType.T_LEFT)
-                elif col.west is True and top.west is False:
-                    rcell.set(corner_type=CornerType.TR)
-                elif col.west is False and top.west is True:
-                    rcell.set(corner_type=CornerType.BR)
-            else:
-                if col.west is True and top.west is True:
-                    rcell.set(corner_type=CornerType.VER)
-        return rcell
+            corner_type = CORNER_TYPES[
+                (col.north << 3) | (prev.north << 2) | (col.west << 1) |
+                top.west
+            ]
+        return self.get_rcell(RCellType.CORNER, corner_type)
 
-    @staticmethod
-    def set_last_col_corner(col: Cell) -> RCell:
+    def set_last_col_corner(self, col: Cell) -> RCell:
         """Return a corner cell for the last column based on the north wall.
 
         Args:
@@ -294,17 +290,14 @@ class RenderMazeGenerator:
         Returns:
             RCell: The rendered corner cell for the last column.
         """
-        rcell: RCell = RCell()
-        rcell.set(type=RCellType.CORNER)
-        if col.north is True:
-            rcell.set(corner_type=CornerType.T_LEFT)
+        if col.north:
+            corner_type = CornerType.T_LEFT
         else:
-            rcell.set(corner_type=CornerType.VER)
-        return rcell
+            corner_type = CornerType.VER
+        return self.get_rcell(RCellType.CORNER, corner_type)
 
     # THIS PRINTS 42 BACKGROUND IN CELLS not continuous
-    @staticmethod
-    def set_hor_wall(col: Cell, top: Cell | None) -> RCell:
+    def set_hor_wall(self, col: Cell, top: Cell | None) -> RCell:
         """Return a horizontal wall RCell based on the top neighbor.
 
         Args:
@@ -314,21 +307,18 @@ class RenderMazeGenerator:
         Returns:
             RCell: The rendered horizontal wall cell.
         """
-        rcell: RCell = RCell()
-        rcell.set(type=RCellType.HORIZONTAL)
-        if top is None:
-            return rcell
-        if col.north is False:
-            rcell.set(open=True)
-            if col.blocked is True and top.blocked is True:
-                rcell.set(blocked=True)
-            elif col.path is True and top.path is True:
-                rcell.set(path=True)
-            elif top.entry or top.exit and col.path is True:  #
-                rcell.set(path=True)
-            elif col.entry or col.exit and top.path is True:  #
-                rcell.set(path=True)
-        return rcell
+        if top is None or col.north:
+            return self.get_rcell(RCellType.HORIZONTAL)
+        # The passage is on the path when both cells are, or when one is and
+        # the other is the entry or the exit
+        blocked = col.blocked and top.blocked
+        path = (
+            (col.path or top.path)
+            and (col.path or col.entry or col.exit)
+            and (top.path or top.entry or top.exit)
+        )
+        return self.get_rcell(
+            RCellType.HORIZONTAL, blocked=blocked, path=path, open=True)
 
     # @staticmethod
     # def set_hor_wall(col: Cell, top: Cell | None) -> RCell:
@@ -361,8 +351,7 @@ class RenderMazeGenerator:
     #     return rcell
 
     # THIS PRINTS 42 BACKGROUND IN CELLS not continuous:
-    @staticmethod
-    def set_ver_wall(col: Cell, prev: Cell | None) -> RCell:
+    def set_ver_wall(self, col: Cell, prev: Cell | None) -> RCell:
         """Return a vertical wall RCell based on the left neighbor.
 
         Args:
@@ -372,21 +361,18 @@ class RenderMazeGenerator:
         Returns:
             RCell: The rendered vertical wall cell.
         """
-        rcell: RCell = RCell()
-        rcell.set(type=RCellType.VERTICAL)
-        if prev is None:
-            return rcell
-        if col.west is False:
-            rcell.set(open=True)
-            if col.blocked is True and prev.blocked is True:
-                rcell.set(blocked=True)
-            elif col.path is True and prev.path is True:
-                rcell.set(path=True)
-            elif (col.exit or col.entry) and prev.path is True:  #
-                rcell.set(path=True)
-            elif col.path is True and (prev.entry or prev.exit):  # #
-                rcell.set(path=True)
-        return rcell
+        if prev is None or col.west:
+            return self.get_rcell(RCellType.VERTICAL)
+        # The passage is on the path when both cells are, or when one is and
+        # the other is the entry or the exit
+        blocked = col.blocked and prev.blocked
+        path = (
+            (col.path or prev.path)
+            and (col.path or col.entry or col.exit)
+            and (prev.path or prev.entry or prev.exit)
+        )
+        return self.get_rcell(
+            RCellType.VERTICAL, blocked=blocked, path=path, open=True)
 
     # @staticmethod
     # def set_ver_wall(col: Cell, prev: Cell | None) -> RCell:
@@ -417,8 +403,7 @@ class RenderMazeGenerator:
     #         rcell.set(blocked=True)
     #     return rcell
 
-    @staticmethod
-    def set_center(col: Cell) -> RCell:
+    def set_center(self, col: Cell) -> RCell:
         """Return a center RCell based on the logical cell type.
 
         Args:
@@ -427,55 +412,29 @@ class RenderMazeGenerator:
         Returns:
             RCell: The rendered center cell.
         """
-        rcell: RCell = RCell()
-        rcell.set(type=RCellType.CENTER)
-        if col.blocked is True:
-            rcell.set(blocked=True)
-        elif col.path is True:
-            rcell.set(path=True)
-        elif col.entry is True:
-            rcell.set(entry=True)
-        elif col.exit is True:
-            rcell.set(exit=True)
-        return rcell
+        # A cell has a single type, so at most one of the flags is set
+        return self.get_rcell(
+            RCellType.CENTER, blocked=col.blocked, path=col.path,
+            entry=col.entry, exit=col.exit)
 
-    def set_last_row(self, c: int, maze: "Maze") -> RCell:
-        """Return the correct RCell for a given position in the last row.
+    def set_last_row(self, c: int, col: Cell) -> tuple[RCell, RCell]:
+        """Return the RCells below a cell of the last maze row.
 
         Args:
-            c (int): Column index in the rendered grid.
-            maze (Maze): The source maze.
+            c (int): Column index of the cell in the maze.
+            col (Cell): The maze cell of the last row.
 
         Returns:
-            RCell: The rendered cell for the last row.
+            tuple[RCell, RCell]: The corner below the west wall of the cell
+                and the horizontal wall below the cell.
         """
-        rcell: RCell = RCell()
-
-        if c % 2 == 0:
-            rcell.set(type=RCellType.CORNER)
-        else:
-            rcell.set(type=RCellType.HORIZONTAL)
-
+        corner_type = CornerType.T_UP if col.west else CornerType.HOR
+        wall = self.get_rcell(RCellType.HORIZONTAL, corner_type)
         # Bottom left corner:
         if c == 0:
-            rcell.set(corner_type=CornerType.BL)
-            return rcell
-
-        row_m: int = maze.height - 1
-        col_m: int = int(c / 2)
-
-        # Bottom right corner
-        if col_m == maze.width:
-            rcell.set(type=RCellType.CORNER)
-            rcell.set(corner_type=CornerType.BR)
-            return rcell
-
-        m_cell: Cell = maze.grid[row_m][col_m]
-        if m_cell.west is True:
-            rcell.set(corner_type=CornerType.T_UP)
-        else:
-            rcell.set(corner_type=CornerType.HOR)
-        return rcell
+            corner_type = CornerType.BL
+        corner = self.get_rcell(RCellType.CORNER, corner_type)
+        return corner, wall
 
     def create(self, maze: "Maze") -> RenderMaze:
         """Generate a RenderMaze from a Maze, filling all RCells.
@@ -493,26 +452,36 @@ class RenderMazeGenerator:
         last_col = render_maze.width - 1
 
         for r, row in enumerate(a_grid):
+            # Rows are looked up once per maze row: the neighbours come from
+            # the row above and the previous iteration
+            top_row = a_grid[r - 1] if r > 0 else None
+            wall_row = r_grid[r*2]
+            center_row = r_grid[r*2 + 1]
+            bottom_row = r_grid[last_row] if r == maze.height - 1 else None
+            prev: Cell | None = None
             # turn 1 Cell into 4 separate RCells
             for c, col in enumerate(row):
-                top = self.get_top_cell(r, c, maze)
-                prev = self. get_prev_cell(r, c, maze)
+                top = top_row[c] if top_row is not None else None
                 # in Order: top left, top right, center left, center right
-                r_grid[r*2][c*2] = self.set_corner(col, top, prev)
-                r_grid[r*2][c*2 + 1] = self.set_hor_wall(col, top)
-                r_grid[r*2 + 1][c*2] = self.set_ver_wall(col, prev)
-                r_grid[r*2 + 1][c*2 + 1] = self.set_center(col)
+                wall_row[c*2] = self.set_corner(col, top, prev)
+                wall_row[c*2 + 1] = self.set_hor_wall(col, top)
+                center_row[c*2] = self.set_ver_wall(col, prev)
+                center_row[c*2 + 1] = self.set_center(col)
+                if bottom_row is not None:
+                    bottom_row[c*2], bottom_row[c*2 + 1] = (
+                        self.set_last_row(c, col))
+                prev = col
 
             # set last corner and vertical wall for each row
             if r == 0:
-                r_grid[r*2][last_col].set(type=RCellType.CORNER)
-                r_grid[r*2][last_col].set(corner_type=CornerType.TR)
+                wall_row[last_col] = self.get_rcell(
+                    RCellType.CORNER, CornerType.TR)
             else:
-                r_grid[r*2][last_col] = self.set_last_col_corner(col)
-            r_grid[r*2 + 1][last_col].set(type=RCellType.VERTICAL)
+                wall_row[last_col] = self.set_last_col_corner(col)
+            center_row[last_col] = self.get_rcell(RCellType.VERTICAL)
 
-        # set last row
-        for c in range(render_maze.width):
-            r_grid[last_row][c] = self.set_last_row(c, maze)
+        # Bottom right corner, the rest of the last row is set in the loop
+        r_grid[last_row][last_col] = self.get_rcell(
+            RCellType.CORNER, CornerType.BR)
 
         return render_maze